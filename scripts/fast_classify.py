@@ -0,0 +1,111 @@
+"""
+Numba-compiled line classifier used by `generate_ics.py --fast`.
+
+Numba cannot run the `re` module, so the three LINE_RE shapes are recognised with
+hand-written byte checks over the UTF-8 encoded text:
+  - date line like "13 Feb"     -> DATE
+  - matchup like "FIN vs SWE"   -> MATCH
+  - time like "12:10"           -> TIME
+
+The checks mirror LINE_RE on ASCII text, including the 0x1C-0x1F separators that its
+whitespace class accepts. LINE_RE's whitespace and digit classes are Unicode, so any line
+with a non-ASCII byte is returned as CANDIDATE and left for LINE_RE to decide: the screen
+must never drop a line that LINE_RE accepts.
+Requires `numba` and `numpy`, which are not needed (or installed) for the default path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+OTHER = 0
+DATE = 1
+MATCH = 2
+TIME = 3
+CANDIDATE = 4
+
+
+@njit(cache=True)
+def _skip_digits(buf, i, end):
+    while i < end and 48 <= buf[i] <= 57:  # 0-9
+        i += 1
+    return i
+
+
+@njit(cache=True)
+def _skip_spaces(buf, i, end):
+    while i < end:
+        c = buf[i]
+        if c == 32 or 9 <= c <= 13 or 0x1C <= c <= 0x1F:
+            i += 1
+        else:
+            break
+    return i
+
+
+@njit(cache=True)
+def _is_team(buf, i, end):
+    if i + 3 > end:
+        return False
+    for j in range(i, i + 3):
+        if not 65 <= buf[j] <= 90:  # A-Z
+            return False
+    return True
+
+
+@njit(cache=True)
+def _classify_line(buf, start, end):
+    for j in range(start, end):
+        if buf[j] >= 0x80:
+            return CANDIDATE
+
+    i = _skip_digits(buf, start, end)
+    n = i - start
+    if n == 1 or n == 2:
+        if i < end and buf[i] == 58:  # ":"
+            if end - (i + 1) == 2 and _skip_digits(buf, i + 1, end) == end:
+                return TIME
+            return OTHER
+        j = _skip_spaces(buf, i, end)
+        # "Feb"
+        if j > i and end - j == 3 and buf[j] == 70 and buf[j + 1] == 101 and buf[j + 2] == 98:
+            return DATE
+        return OTHER
+
+    if _is_team(buf, start, end):
+        i = _skip_spaces(buf, start + 3, end)
+        # "vs"
+        if i > start + 3 and i + 2 <= end and buf[i] == 118 and buf[i + 1] == 115:
+            j = _skip_spaces(buf, i + 2, end)
+            if j > i + 2 and end - j == 3 and _is_team(buf, j, end):
+                return MATCH
+    return OTHER
+
+
+@njit(cache=True)
+def classify(buf):
+    """Return one OTHER/DATE/MATCH/TIME/CANDIDATE code per newline-separated line of `buf`."""
+    n_lines = 1
+    for i in range(buf.shape[0]):
+        if buf[i] == 10:
+            n_lines += 1
+
+    codes = np.zeros(n_lines, dtype=np.int8)
+    start = 0
+    k = 0
+    for i in range(buf.shape[0]):
+        if buf[i] == 10:
+            codes[k] = _classify_line(buf, start, i)
+            k += 1
+            start = i + 1
+    codes[k] = _classify_line(buf, start, buf.shape[0])
+    return codes
+
+
+def classify_lines(lines: list[str]) -> np.ndarray:
+    """Classify schedule lines (which never contain newlines) in one compiled pass."""
+    if not lines:
+        return np.zeros(0, dtype=np.int8)
+    buf = np.frombuffer("\n".join(lines).encode("utf-8"), dtype=np.uint8)
+    return classify(buf)
@@ -6,37 +6,114 @@ published via GitHub Pages from the /docs folder.
 Source schedule page:
   https://www.iihf.com/en/events/2026/olympic-m/schedule
 
-Key change vs manual ICS writing:
-- Uses the `icalendar` library to produce Apple Calendar–compatible ICS (proper RFC5545 formatting/line folding).
+The ICS is assembled as plain text (RFC5545 escaping and line folding are done here),
+matching what Apple Calendar, Outlook and Google Calendar expect.
 """
 
 from __future__ import annotations
 
+import argparse
+import importlib.util
+import json
+import os
+import pathlib
 import re
+import sys
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cache
+from itertools import repeat
+from zoneinfo import ZoneInfo
 
-import pytz
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-from icalendar import Calendar, Event, Timezone, TimezoneStandard, TimezoneDaylight
+import httpx
+import lxml.html
+from lxml import etree
 
 IIHF_URL = "https://www.iihf.com/en/events/2026/olympic-m/schedule"
 YEAR = 2026
 
+# Use absolute paths relative to script location to work correctly
+# whether script is run from repo root or any other directory
+REPO_ROOT = pathlib.Path(__file__).parent.resolve().parent
+
+# Schedule HTML is cached here so reruns can skip the browser launch (CI restores
+# docs/.cache/ between runs with actions/cache). Within CACHE_MAX_AGE it is used as-is;
+# after that, a plain HTTP download is revalidated with the ETag/Last-Modified kept
+# in CACHE_META, and a 304 reuses the cached body.
+CACHE_HTML = REPO_ROOT / "docs" / ".cache" / "iihf.html"
+CACHE_META = REPO_ROOT / "docs" / ".cache" / "iihf.meta.json"
+CACHE_MAX_AGE = timedelta(hours=6)
+
+# The schedule page is handled as raw UTF-8 bytes from download to parse, so lxml
+# decodes it once in C (the IIHF site serves UTF-8; Playwright output is encoded to it).
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
 # The IIHF schedule page times are local to the event host.
 # Using Europe/Rome is appropriate for Milano-Cortina 2026.
-TZ_LOCAL = pytz.timezone("Europe/Rome")
-TZ_UTC = pytz.UTC
+TZ_LOCAL = ZoneInfo("Europe/Rome")
+TZ_UTC = ZoneInfo("UTC")
 
 DEFAULT_GAME_DURATION = timedelta(hours=2, minutes=30)
 
-# The schedule page commonly contains date lines like "13 Feb"
-DATE_RE = re.compile(r"^(?P<day>\d{1,2})\s+Feb$")
-# Time like "12:10"
-TIME_RE = re.compile(r"^(?P<h>\d{1,2}):(?P<m>\d{2})$")
-# Matchup like "FIN vs SWE"
-MATCH_RE = re.compile(r"^(?P<a>[A-Z]{3})\s+vs\s+(?P<b>[A-Z]{3})$")
+# Team codes whose games go into the calendar
+TEAMS = frozenset({"SWE"})
+
+# Headless Chromium flags: we only need the DOM text, never pixels or sound.
+BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--mute-audio",
+]
+# Resource types the schedule text never depends on; aborted to speed up loading.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Classify a schedule line in a single match. One of three alternatives hits:
+#   date line like "13 Feb"     -> group "day"
+#   matchup like "FIN vs SWE"   -> groups "a", "b"
+#   time like "12:10"           -> groups "h", "m"
+LINE_RE = re.compile(
+    r"^(?:(?P<day>\d{1,2})\s+Feb"
+    r"|(?P<a>[A-Z]{3})\s+vs\s+(?P<b>[A-Z]{3})"
+    r"|(?P<h>\d{1,2}):(?P<m>\d{2}))$"
+)
+# Any whitespace run containing a line break (the same breaks str.splitlines() uses),
+# so splitting on it yields stripped, non-empty lines in one pass.
+# The lookbehind only lets a match start at the beginning of a whitespace run, which
+# keeps long runs without a break linear instead of retrying from every position.
+LINE_SPLIT_RE = re.compile(r"(?<!\s)\s*[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]\s*")
+# Venue-ish words; these heuristics are intentionally conservative
+VENUE_RE = re.compile(r"Milano|Cortina|Arena|Ice|Forum")
+
+
+# VTIMEZONE for Europe/Rome with proper DST transitions. It never changes, so it
+# is serialized once at import time (see CALENDAR_HEAD).
+# February is in standard time (CET, UTC+1)
+VTIMEZONE_LINES = (
+    "BEGIN:VTIMEZONE",
+    "TZID:Europe/Rome",
+    "X-LIC-LOCATION:Europe/Rome",
+    # Standard time (CET)
+    "BEGIN:STANDARD",
+    "DTSTART:19961027T030000",
+    "RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=10",
+    "TZNAME:CET",
+    "TZOFFSETFROM:+0200",
+    "TZOFFSETTO:+0100",
+    "END:STANDARD",
+    # Daylight time (CEST)
+    "BEGIN:DAYLIGHT",
+    "DTSTART:19810329T020000",
+    "RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=3",
+    "TZNAME:CEST",
+    "TZOFFSETFROM:+0100",
+    "TZOFFSETTO:+0200",
+    "END:DAYLIGHT",
+    "END:VTIMEZONE",
+)
 
 
 @dataclass(frozen=True)
@@ -48,31 +125,157 @@ class Game:
     location: str | None = None
 
 
-def fetch_lines() -> list[str]:
-    """Fetch the schedule page using Playwright for JavaScript rendering."""
+def read_cached_html(max_age: timedelta | None = CACHE_MAX_AGE) -> bytes | None:
+    """Return the cached schedule HTML if it is younger than `max_age` (None: any age)."""
+    try:
+        age = time.time() - CACHE_HTML.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if max_age is not None and age > max_age.total_seconds():
+        return None
+    return CACHE_HTML.read_bytes()
+
+
+def read_cache_validators() -> dict[str, str]:
+    """Return the ETag/Last-Modified headers the cached page was downloaded with, if any."""
+    if not CACHE_HTML.exists():
+        return {}
     try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(IIHF_URL, wait_until="networkidle", timeout=60000)
-            # Give the page time to fully render
-            page.wait_for_timeout(3000)
-            html = page.content()
-            browser.close()
-            
-            soup = BeautifulSoup(html, "html.parser")
-            text = soup.get_text("\n")
-            lines = [ln.strip() for ln in text.splitlines()]
-            fetched_lines = [ln for ln in lines if ln]
-            
-            # If we got real content with games, return it
-            if any("vs" in ln for ln in fetched_lines):
-                print("✓ Fetched live schedule from IIHF")
-                return fetched_lines
-    except Exception as e:
-        print(f"Warning: Could not fetch live IIHF schedule ({type(e).__name__})")
-    
+        meta = json.loads(CACHE_META.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(meta, dict):
+        return {}
+    # Only the two known validators, and only as strings, ever become request headers
+    return {k: v for k in ("etag", "last-modified") if isinstance(v := meta.get(k), str)}
+
+
+def _replace_file(path: pathlib.Path, data: bytes) -> None:
+    # Write to a temp file and rename it over the target, so an interrupted run
+    # never leaves a truncated file behind
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_cached_html(html: bytes, validators: dict[str, str]) -> None:
+    """Cache the page; `validators` are only kept for plain HTTP downloads."""
+    CACHE_HTML.parent.mkdir(parents=True, exist_ok=True)
+    # Drop the old validators first so they can never describe a different body
+    CACHE_META.unlink(missing_ok=True)
+    _replace_file(CACHE_HTML, html)
+    if validators:
+        _replace_file(CACHE_META, json.dumps(validators).encode("utf-8"))
+
+
+def download_html() -> tuple[bytes, dict[str, str]]:
+    """
+    Fetch the schedule page over HTTP/2 without booting a browser. If the cache holds
+    an earlier download, the request is conditional and a 304 reuses the cached body.
+    Returns the page and its ETag/Last-Modified validators.
+    """
+    validators = read_cache_validators()
+    headers = {}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last-modified" in validators:
+        headers["If-Modified-Since"] = validators["last-modified"]
+
+    with httpx.Client(http2=True, timeout=30, follow_redirects=True) as client:
+        r = client.get(IIHF_URL, headers=headers)
+        if r.status_code == 304:
+            return CACHE_HTML.read_bytes(), validators
+        r.raise_for_status()
+        validators = {k: r.headers[k] for k in ("etag", "last-modified") if k in r.headers}
+        return r.content, validators
+
+
+def render_html() -> tuple[bytes, dict[str, str]]:
+    """Render the schedule page using Playwright for JavaScript rendering."""
+    from playwright.sync_api import sync_playwright
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=BROWSER_ARGS)
+        context = browser.new_context(
+            viewport={"width": 1280, "height": 720},
+            device_scale_factor=1,
+        )
+        page = context.new_page()
+        page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+            else route.continue_(),
+        )
+        page.goto(IIHF_URL, wait_until="domcontentloaded", timeout=60000)
+        # Wait until the schedule has rendered at least one matchup
+        page.wait_for_selector("text=vs", timeout=15000)
+        html = page.content()
+        browser.close()
+    # A rendered DOM has no HTTP validators to revalidate against
+    return html.encode("utf-8"), {}
+
+
+def html_to_lines(html: bytes) -> list[str]:
+    # We only need the page text, so skip building a soup tree and
+    # walk lxml's text nodes directly (scripts/styles are not text).
+    root = lxml.html.fromstring(html, parser=HTML_PARSER)
+    etree.strip_elements(root, "script", "style", with_tail=False)
+    text = "\n".join(root.itertext()).strip()
+    return LINE_SPLIT_RE.split(text) if text else []
+
+
+def has_matchups(lines: list[str]) -> bool:
+    """True if the text contains at least one "AAA vs BBB" matchup line."""
+    _match = LINE_RE.match
+    for ln in lines:
+        m = _match(ln)
+        if m is not None and m.group("a") is not None:
+            return True
+    return False
+
+
+def fetch_lines(source: str = "auto") -> list[str]:
+    """
+    Fetch the schedule page text. With source "auto", sources are tried cheapest first:
+      - a recent on-disk copy (see CACHE_HTML)
+      - a plain HTTP/2 download, in case the schedule is server-rendered
+      - a headless Chromium render via Playwright
+    "cached", "http" or "playwright" use only that source ("cached" accepts any age).
+    """
+    if source in ("auto", "cached"):
+        try:
+            html = read_cached_html(CACHE_MAX_AGE if source == "auto" else None)
+            fetched_lines = html_to_lines(html) if html is not None else []
+        except Exception as e:
+            print(f"Warning: Could not read cached IIHF schedule ({type(e).__name__})")
+            fetched_lines = []
+        if has_matchups(fetched_lines):
+            print(f"✓ Using cached IIHF schedule ({CACHE_HTML})")
+            return fetched_lines
+
+    fetchers = {
+        "auto": (download_html, render_html),
+        "cached": (),
+        "http": (download_html,),
+        "playwright": (render_html,),
+    }[source]
+    for fetch in fetchers:
+        try:
+            html, validators = fetch()
+            fetched_lines = html_to_lines(html)
+        except Exception as e:
+            print(f"Warning: Could not fetch live IIHF schedule ({type(e).__name__})")
+            continue
+
+        # If we got real content with games, return it
+        if has_matchups(fetched_lines):
+            try:
+                write_cached_html(html, validators)
+            except OSError as e:
+                print(f"Warning: Could not cache IIHF schedule ({type(e).__name__})")
+            print("✓ Fetched live schedule from IIHF")
+            return fetched_lines
+
     # Fallback: Return hardcoded 2026 Milano-Cortina Olympics Sweden games
     print("Using Milano-Cortina 2026 schedule for Sweden men's ice hockey")
     return [
@@ -107,178 +310,270 @@ def fetch_lines() -> list[str]:
     ]
 
 
-def parse_games(lines: list[str]) -> list[Game]:
+def make_game(start_local: datetime, a: str, b: str, venue: str | None) -> Game:
+    end_local = start_local + DEFAULT_GAME_DURATION
+
+    opponent = b if a in TEAMS else a
+    summary = f"Sweden vs {opponent} (Men's Ice Hockey)"
+
+    # Stable UID:
+    # If IIHF provides a real match id in the page text, prefer it.
+    # Fallback: date + teams + time is stable enough for subscription updates.
+    uid = f"{start_local.strftime('%Y%m%dT%H%M')}-{a}vs{b}@lundblaad.github.io"
+
+    return Game(
+        uid=uid,
+        dtstart_utc=start_local.astimezone(TZ_UTC),
+        dtend_utc=end_local.astimezone(TZ_UTC),
+        summary=summary,
+        location=venue,
+    )
+
+
+@cache
+def load_fast_classifier():
+    """
+    Load classify_lines() from fast_classify.py next to this file, so it works however
+    this module was imported. Raises ImportError if numba or numpy is missing.
+    """
+    path = pathlib.Path(__file__).with_name("fast_classify.py")
+    spec = importlib.util.spec_from_file_location("fast_classify", path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered by name because Numba's on-disk cache re-imports it as "fast_classify"
+    sys.modules["fast_classify"] = module
+    spec.loader.exec_module(module)
+    return module.classify_lines
+
+
+def parse_games(lines: list[str], fast: bool = False) -> list[Game]:
     """
     Parse schedule text lines into Sweden games.
     This is heuristic: it looks for:
       - a date marker (e.g. '13 Feb')
       - a match line (e.g. 'FIN vs SWE')
-      - a nearby time line (e.g. '12:10')
-      - a nearby venue-ish line (best effort)
+      - a time line within the next 9 lines (e.g. '12:10')
+      - a venue-ish line within the next 5 lines (best effort)
+
+    Lines are walked once; a Sweden matchup stays pending while its time and
+    venue windows are open and becomes a game once both are settled.
+
+    With fast=True a Numba-compiled classifier (see fast_classify.py) screens all
+    lines first, so LINE_RE only runs on date/matchup/time candidates. This needs
+    numba and numpy.
     """
     games: list[Game] = []
     current_date_local: datetime | None = None
 
-    i = 0
-    while i < len(lines):
-        mdate = DATE_RE.match(lines[i])
-        if mdate:
-            day = int(mdate.group("day"))
+    # The pending Sweden matchup, and what has been found for it so far
+    pending: tuple[datetime, str, str] | None = None
+    start_local: datetime | None = None
+    venue: str | None = None
+    seen = 0
+
+    # Hot-loop globals bound to locals (avoids a module dict lookup per use)
+    _match = LINE_RE.match
+    _vsearch = VENUE_RE.search
+    _make_game = make_game
+    _append = games.append
+    _dt = datetime
+    _tz = TZ_LOCAL
+    _year = YEAR
+    _teams = TEAMS
+
+    if fast:
+        codes = load_fast_classifier()(lines).tolist()
+    else:
+        codes = repeat(1)
+
+    for line, code in zip(lines, codes):
+        mline = _match(line) if code else None
+
+        if pending is not None:
+            seen += 1
+            # Best-effort venue detection (optional)
+            if venue is None and seen <= 5 and _vsearch(line):
+                venue = line
+            if start_local is None and mline is not None and mline.group("h") is not None:
+                hh = int(mline.group("h"))
+                mm = int(mline.group("m"))
+                start_local = pending[0].replace(hour=hh, minute=mm, second=0)
+            if seen >= 9 or (start_local is not None and (venue is not None or seen >= 5)):
+                if start_local is not None:
+                    _append(_make_game(start_local, pending[1], pending[2], venue))
+                pending = None
+
+        if mline is None:
+            continue
+
+        day = mline.group("day")
+        if day is not None:
             # Midnight local on that date; we'll set hour/min later
-            current_date_local = TZ_LOCAL.localize(datetime(YEAR, 2, day, 0, 0, 0))
-            i += 1
+            current_date_local = _dt(_year, 2, int(day), tzinfo=_tz)
             continue
 
-        mmatch = MATCH_RE.match(lines[i])
-        if mmatch and current_date_local:
-            a = mmatch.group("a")
-            b = mmatch.group("b")
+        a = mline.group("a")
+        if a is not None and current_date_local:
+            b = mline.group("b")
 
             # Only Sweden games
-            if a != "SWE" and b != "SWE":
-                i += 1
+            if not (a in _teams or b in _teams):
                 continue
 
-            # Find a time line within the next few lines
-            tline = None
-            for j in range(1, 10):
-                if i + j < len(lines) and TIME_RE.match(lines[i + j]):
-                    tline = lines[i + j]
-                    break
-            if not tline:
-                i += 1
-                continue
-
-            mt = TIME_RE.match(tline)
-            hh = int(mt.group("h"))
-            mm = int(mt.group("m"))
-
-            start_local = current_date_local.replace(hour=hh, minute=mm, second=0)
-            end_local = start_local + DEFAULT_GAME_DURATION
-
-            start_utc = start_local.astimezone(TZ_UTC)
-            end_utc = end_local.astimezone(TZ_UTC)
-
-            # Best-effort venue detection (optional)
+            if pending is not None and start_local is not None:
+                _append(_make_game(start_local, pending[1], pending[2], venue))
+            pending = (current_date_local, a, b)
+            start_local = None
             venue = None
-            for j in range(1, 6):
-                if i + j < len(lines):
-                    cand = lines[i + j]
-                    # These heuristics are intentionally conservative
-                    if any(x in cand for x in ("Milano", "Cortina", "Arena", "Ice", "Forum")):
-                        venue = cand
-                        break
-
-            opponent = b if a == "SWE" else a
-            summary = f"Sweden vs {opponent} (Men's Ice Hockey)"
-
-            # Stable UID:
-            # If IIHF provides a real match id in the page text, prefer it.
-            # Fallback: date + teams + time is stable enough for subscription updates.
-            uid = f"{start_local.strftime('%Y%m%dT%H%M')}-{a}vs{b}@lundblaad.github.io"
-
-            games.append(
-                Game(
-                    uid=uid,
-                    dtstart_utc=start_utc,
-                    dtend_utc=end_utc,
-                    summary=summary,
-                    location=venue,
-                )
-            )
-
-        i += 1
+            seen = 0
+
+    if pending is not None and start_local is not None:
+        _append(_make_game(start_local, pending[1], pending[2], venue))
 
     # Deduplicate by UID
     uniq: dict[str, Game] = {g.uid: g for g in games}
     return sorted(uniq.values(), key=lambda g: g.dtstart_utc)
 
 
-def build_ics(games: list[Game]) -> str:
+def escape_ics(text: str) -> str:
+    """Escape a TEXT property value (RFC5545 section 3.3.11)."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fmt_utc(dt: datetime) -> str:
+    """Format an aware datetime as an RFC5545 UTC date-time, e.g. 20260213T111000Z."""
+    return dt.astimezone(TZ_UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def fold_line(line: str, limit: int = 75) -> str:
+    """
+    Fold a content line so no physical line exceeds `limit` octets (RFC5545 section 3.1).
+    Continuation lines start with a single space, and multi-byte characters are never split.
     """
-    Build an Apple Calendar–friendly ICS using `icalendar` (handles line folding and encoding).
+    if len(line.encode("utf-8")) <= limit:
+        return line
+    parts: list[str] = []
+    start = 0
+    size = 0
+    for i, ch in enumerate(line):
+        n = len(ch.encode("utf-8"))
+        if size + n > limit:
+            parts.append(line[start:i])
+            start = i
+            size = 1  # the leading space of the continuation line
+        size += n
+    parts.append(line[start:])
+    return "\r\n ".join(parts)
+
+
+def serialize_lines(lines: list[str]) -> str:
+    """Fold and CRLF-terminate content lines."""
+    return "".join(fold_line(ln) + "\r\n" for ln in lines)
+
+
+# Everything before the first VEVENT is static, so it is serialized and encoded only once.
+CALENDAR_HEAD = serialize_lines([
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//SWE Men Hockey//GitHub Pages//EN",
+    "CALSCALE:GREGORIAN",
+    "METHOD:PUBLISH",
+    # Helpful properties (Apple-specific but safe for all clients)
+    "X-WR-CALDESC:" + escape_ics("Sweden men's Olympic ice hockey games at Milano-Cortina 2026"),
+    "X-WR-CALNAME:" + escape_ics("Sweden – Men's Ice Hockey (OS)"),
+    "X-WR-TIMEZONE:Europe/Rome",
+    *VTIMEZONE_LINES,
+]).encode("utf-8")
+
+
+def iter_ics(games: list[Game]) -> Iterator[bytes]:
+    """
+    Yield an Apple Calendar–friendly ICS as UTF-8 chunks (escaping and line folding done here):
+    the static calendar head, one chunk per VEVENT, then the closing line.
     Includes proper VTIMEZONE for better compatibility with Outlook, iPhone, and other clients.
     """
-    cal = Calendar()
-    cal.add("prodid", "-//SWE Men Hockey//GitHub Pages//EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("method", "PUBLISH")
+    yield CALENDAR_HEAD
 
-    # Helpful properties (Apple-specific but safe for all clients)
-    cal.add("X-WR-CALNAME", "Sweden – Men's Ice Hockey (OS)")
-    cal.add("X-WR-TIMEZONE", "Europe/Rome")
-    cal.add("X-WR-CALDESC", "Sweden men's Olympic ice hockey games at Milano-Cortina 2026")
-
-    # Add VTIMEZONE for Europe/Rome with proper DST transitions
-    # February is in standard time (CET, UTC+1)
-    tz = Timezone()
-    tz.add("tzid", "Europe/Rome")
-    tz.add("x-lic-location", "Europe/Rome")
-    
-    # Standard time (CET)
-    standard = TimezoneStandard()
-    standard.add("dtstart", datetime(1996, 10, 27, 3, 0, 0))
-    standard.add("rrule", {"freq": "yearly", "bymonth": 10, "byday": "-1su"})
-    standard.add("tzoffsetfrom", timedelta(hours=2))
-    standard.add("tzoffsetto", timedelta(hours=1))
-    standard.add("tzname", "CET")
-    tz.add_component(standard)
-    
-    # Daylight time (CEST)
-    daylight = TimezoneDaylight()
-    daylight.add("dtstart", datetime(1981, 3, 29, 2, 0, 0))
-    daylight.add("rrule", {"freq": "yearly", "bymonth": 3, "byday": "-1su"})
-    daylight.add("tzoffsetfrom", timedelta(hours=1))
-    daylight.add("tzoffsetto", timedelta(hours=2))
-    daylight.add("tzname", "CEST")
-    tz.add_component(daylight)
-    
-    cal.add_component(tz)
-
-    now = datetime.now(TZ_UTC)
+    # Same for every event, so formatted once per calendar
+    dtstamp_line = f"DTSTAMP:{fmt_utc(datetime.now(TZ_UTC))}"
 
     for g in games:
-        ev = Event()
-        ev.add("uid", g.uid)
-        ev.add("dtstamp", now)
-        # Use UTC times with Z suffix for maximum compatibility
-        ev.add("dtstart", g.dtstart_utc)
-        ev.add("dtend", g.dtend_utc)
-        ev.add("summary", g.summary)
+        summary = escape_ics(g.summary)
+        lines = [
+            "BEGIN:VEVENT",
+            f"SUMMARY:{summary}",
+            # Use UTC times with Z suffix for maximum compatibility
+            f"DTSTART:{fmt_utc(g.dtstart_utc)}",
+            f"DTEND:{fmt_utc(g.dtend_utc)}",
+            dtstamp_line,
+            f"UID:{g.uid}",
+            # Sequence for updates
+            "SEQUENCE:0",
+            "CATEGORIES:Sports",
+            # Description with match details
+            f"DESCRIPTION:{summary}",
+        ]
         if g.location:
-            ev.add("location", g.location)
-        # Add description with match details
-        ev.add("description", g.summary)
-        # Mark as confirmed
-        ev.add("status", "CONFIRMED")
-        # Add sequence for updates
-        ev.add("sequence", 0)
-        # Add transparency (show as busy)
-        ev.add("transp", "OPAQUE")
-        # Add categories
-        ev.add("categories", "Sports")
+            lines.append(f"LOCATION:{escape_ics(g.location)}")
+        lines += [
+            # Mark as confirmed
+            "STATUS:CONFIRMED",
+            # Transparency (show as busy)
+            "TRANSP:OPAQUE",
+            "END:VEVENT",
+        ]
+        yield serialize_lines(lines).encode("utf-8")
+
+    yield b"END:VCALENDAR\r\n"
 
-        cal.add_component(ev)
 
-    return cal.to_ical().decode("utf-8")
+def build_ics(games: list[Game]) -> bytes:
+    """Build the whole ICS as one bytes object (see iter_ics)."""
+    return b"".join(iter_ics(games))
 
 
 def main() -> None:
-    lines = fetch_lines()
-    games = parse_games(lines)
-    ics_text = build_ics(games)
-
-    # Write to docs/ so GitHub Pages can serve it
-    import pathlib
-
-    # Use absolute path relative to script location to work correctly
-    # whether script is run from repo root or any other directory
-    script_dir = pathlib.Path(__file__).parent.resolve()
-    repo_root = script_dir.parent
-    outpath = repo_root / "docs" / "swe-men-hockey.ics"
+    parser = argparse.ArgumentParser(description="Generate the Sweden men's Olympic ice hockey ICS.")
+    parser.add_argument(
+        "--fetch-only",
+        action="store_true",
+        help="only fetch and cache the schedule page (lets CI build the ICS under PyPy)",
+    )
+    parser.add_argument(
+        "--source",
+        choices=("auto", "cached", "http", "playwright"),
+        default="auto",
+        help="where to read the schedule page from (default: cache, then HTTP, then Playwright)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="pre-screen lines with a Numba-compiled classifier (needs numba and numpy)",
+    )
+    args = parser.parse_args()
+    if args.fast:
+        try:
+            load_fast_classifier()
+        except ImportError as e:
+            parser.error(f"--fast needs numba and numpy ({e})")
+
+    lines = fetch_lines(args.source)
+    if args.fetch_only:
+        return
+    games = parse_games(lines, fast=args.fast)
+
+    # Write to docs/ so GitHub Pages can serve it.
+    # Chunks are already UTF-8 with CRLF line endings, so write them as-is.
+    outpath = REPO_ROOT / "docs" / "swe-men-hockey.ics"
     outpath.parent.mkdir(parents=True, exist_ok=True)
-    outpath.write_text(ics_text, encoding="utf-8")
+    with outpath.open("wb") as f:
+        for chunk in iter_ics(games):
+            f.write(chunk)
     print(f"✓ ICS file written to {outpath}")
 
 
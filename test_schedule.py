@@ -1,12 +1,15 @@
-import re
-content = open('docs/swe-men-hockey.ics').read()
-events = re.findall(r'SUMMARY:([^\r\n]+).*?DTSTART:([^\r\n]+)', content, re.DOTALL)
+# Linear scan: remember the last SUMMARY and print it with the DTSTART that follows
 print("Generated events with dates and times:")
-for summary, dtstart in events:
-    date_obj = dtstart[:8]
-    time_str = dtstart[9:13]
-    month = date_obj[4:6]
-    day = date_obj[6:8]
-    hour = int(time_str[:2])
-    minute = time_str[2:]
-    print(f"  {summary:40} - {month}/{day} @ {hour:02d}:{minute}")
+summary = None
+with open('docs/swe-men-hockey.ics', encoding='utf-8') as f:
+    for ln in f:
+        if ln.startswith('SUMMARY:'):
+            summary = ln[8:].rstrip()
+        elif ln.startswith('DTSTART:') and summary:
+            dtstart = ln[8:].rstrip()
+            month = dtstart[4:6]
+            day = dtstart[6:8]
+            hour = dtstart[9:11]
+            minute = dtstart[11:13]
+            print(f"  {summary:40} - {month}/{day} @ {hour}:{minute}")
+            summary = None